@@ -7,24 +7,29 @@ Async crawler for news site https://news.ycombinator.com that:
         - save downloaded news pages into {dir}/{news-id}
 """
 import os
+import gc
 import sys
 import logging
 import argparse
-import json
 import time
+import uuid
 
 import asyncio
-import aiohttp
-import aiofiles
+import httpx  # https://www.python-httpx.org - http/2 multiplexing (via h2)
+from aiofile import async_open  # caio based - kernel aio on linux (no thread pool hop)
+import orjson  # https://github.com/ijl/orjson
+import xxhash  # https://github.com/ifduyue/python-xxhash
 from contextvars import ContextVar  # added for usage testing (some experiments)
 import uvloop  # https://github.com/MagicStack/uvloop
 
-from typing import Callable
-from functools import wraps, partial
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Callable, AsyncIterator, Awaitable, NamedTuple, Optional
+from contextlib import asynccontextmanager
+from functools import wraps, lru_cache
 from mimetypes import guess_extension
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser  # https://github.com/rushter/selectolax
 
 RESTART_INTERVAL = 60.  # in secs
 START_PAGE = 'https://news.ycombinator.com'
@@ -32,12 +37,19 @@ COMMENTS_PAGE_TEMPLATE = START_PAGE + '/item?id={news_id}'
 TOP_NEWS = 4
 OUTPUT_DIR = 'news'  # news/{id}/{main_page_name}.{mimetypes.guess_extention()}
 MAX_FILE_NAME_LENGTH = 126
+STREAM_CHUNK_SIZE = 64 * 1024  # response body is streamed to disk by chunks of this size
+CAS_DIR_NAME = '.cas'  # {output}/.cas/{xxh3_128 of content}.{ext} - saved pages are symlinks into it
+SEEN_FILE_NAME = '.seen'  # {output}/.seen - hex xxh3_64 digests of processed news ids, one per line
 # not to hang host with open requests
-REQUEST_CHUNKS = 256  # maximum number of concurrently open requests - semaphore (or aiohttp.TCPConnector(limit=...)) 
+REQUEST_CHUNKS = 256  # maximum number of concurrently open connections - httpx.Limits(max_connections=...)
 REQUEST_TOTAL_TIMEOUT = 16.  # in secs
 REQUEST_CONNECTION_TIMEOUT = 1.  # in secs
 # not to be blocked by providers
-REQUEST_LIMIT_PER_HOST = 8
+REQUEST_LIMIT_PER_HOST = 8  # concurrent requests per host (multiplexed over one connection for http/2 hosts)
+# reuse connections instead of paying tcp + tls handshake per request
+REQUEST_KEEPALIVE_TIMEOUT = 75.  # in secs
+# fewer gen0 collections during parse / fan-out bursts (default is (700, 10, 10))
+GC_THRESHOLDS = (50_000, 10, 10)
 # todo: + REQUEST_DELAY_PER_HOST = 0.42  
 _request_headers = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9", 
@@ -46,12 +58,13 @@ _request_headers = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.101 Safari/537.36", 
 }  
 
-from collections import defaultdict
-news_stats = defaultdict(dict)
+from types import SimpleNamespace
+news_stats = {}  # news_id -> SimpleNamespace (attribute access is cheaper than dict get/set on fetch hot path)
+_cas_names: set[str] = set()  # {xxh3_128 hex digest}{ext} names of contents already written into CAS_DIR_NAME
 
 # context vars declaration:
 cv_news_id: ContextVar[str] = ContextVar('Id of news processed in current context', default = None)
-# cv_news_stats: ContextVar[dir] = ContextVar('Current news stats dict', default = None)  # == news_stats[cv_news_id.get()] 
+# cv_news_stats: ContextVar[SimpleNamespace] = ContextVar('Current news stats', default = None)  # == news_stats[cv_news_id.get()] 
 
 def parse_input_args():
     parser = argparse.ArgumentParser()
@@ -81,147 +94,278 @@ def fetch_profile(func):
     #         return await func(*args, **kwargs)
     #     else:
     #         return func(*args, **kwargs)
+    # explicit fetch_page signature - no *args / **kwargs packing per call
     @wraps(func)
-    async def wrapper(*args, **kwargs):
-        if (news_id := cv_news_id.get()) and (stats := news_stats[news_id]):
-            stats['fetch_total_count'] = stats.get('fetch_total_count',0) + 1
-            start_ts = time.perf_counter()
-            result = await func(*args, **kwargs)
-            stats['fetch_total_time'] = stats.get('fetch_total_time',0) + time.perf_counter() - start_ts
-            stats['fetch_total_size'] = stats.get('fetch_total_size',0) + len(result[0])
-            stats['fetch_ok_count'] = stats.get('fetch_ok_count',0) + 1
+    async def wrapper(url: str, sink: Optional[Callable] = None):
+        if (news_id := cv_news_id.get()) and (stats := news_stats.get(news_id)):
+            stats.fetch_total_count += 1
+            result = await func(url, sink)  # fetch_total_time / fetch_total_size are counted by func (see profile_fetch)
+            stats.fetch_ok_count += 1
             return result
-        return await func(*args, **kwargs)
+        return await func(url, sink)
     return wrapper
 
-@fetch_profile
-async def session_fetch(url: str, session: aiohttp.ClientSession) -> tuple[bytes, str]:
-    async with session.get(url) as response:  
-        response.raise_for_status()  # if 400 <= self.status ... raise ClientResponseError - for now it's okay
-        content = await response.read()
-        return content, response.headers['Content-Type']
-
-# async def timed_session_fetch(url: str, session: aiohttp.ClientSession, timeout: float):
-#     #*When a timeout occurs, it cancels the task and raises TimeoutError. 
-#     # To avoid the task cancellation, wrap it in shield().
-#     # If the wait is cancelled, the task is also cancelled.
-#     return await asyncio.wait_for(session_fetch(url, session), timeout=timeout)   
-
-# async def sem_timed_session_fetch(url: str, sem: asyncio.Semaphore, timeout: float, session: aiohttp.ClientSession):
-#     async with sem:
-#         logging.debug('semaphore passed with value %d', sem._value)
-#         return await timed_session_fetch(url, session, timeout)
-
-async def save_content(content: bytes, dir_path: Path, url: str, content_type: str, prefix: str = ''):
-    logging.debug('Start saving content in [%s] from [%s] with [%s] and length [%d]', dir_path, url, content_type, len(content))
-    url_parts = urlparse(url)
+def profile_fetch(elapsed: float, size: int = 0):
+    # counted where bytes are received - time spent by sink (disk writes, cas) is not fetch time
+    if (news_id := cv_news_id.get()) and (stats := news_stats.get(news_id)):
+        stats.fetch_total_time += elapsed
+        stats.fetch_total_size += size
+
+async def _profiled_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    chunks = aiter(chunks)
+    while True:
+        start_ts = time.perf_counter()
+        try:
+            chunk = await anext(chunks)
+        except StopAsyncIteration:
+            profile_fetch(time.perf_counter() - start_ts)
+            return
+        profile_fetch(time.perf_counter() - start_ts, len(chunk))
+        yield chunk
+
+class ContentInfo(NamedTuple):
+    mime: str
+    charset: Optional[str]
+    ext: str
+
+@lru_cache(maxsize=256)
+def parse_content_type(content_type: str) -> ContentInfo:
+    # content types cluster heavily (text/html; charset=utf-8, application/pdf, ...) - header is parsed once per distinct value
+    mime, _, params = content_type.partition(';')
+    mime = mime.strip().lower()
+    charset = params.partition('charset=')[-1].strip().strip('"') or None
+    return ContentInfo(mime, charset, guess_extension(mime) or '.bin')  # unknown mimetype -> .bin
+
+def decode_page(content: bytes, content_info: ContentInfo) -> str:
+    try:
+        return content.decode(content_info.charset or 'utf-8', 'replace')
+    except LookupError:  # unknown charset in Content-Type header
+        return content.decode('utf-8', 'replace')
+
+def make_fetch_page(client: httpx.AsyncClient, timeout: float, limit: int, limit_per_host: int) -> Callable:
+    # closure instead of functools.partial - no args/kwargs merging per call, client is bound as LOAD_FAST default
+    # without sink: returns (content, content_info) - for pages to be parsed
+    # with sink: body is streamed into sink(chunks, content_info) and its result is returned - no full page in memory
+    # httpx has no per host limit of its own - host semaphore lives while host has pending requests
+    host_limits: dict[str, list] = {}  # host -> [semaphore, pending requests count]
+    @asynccontextmanager
+    async def host_limit(host: str):
+        if (entry := host_limits.get(host)) is None:
+            entry = host_limits[host] = [asyncio.Semaphore(limit_per_host), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del host_limits[host]  # map does not grow with every host ever seen
+    # http/2 streams are not bounded by max_connections - total outstanding requests are bounded by semaphore
+    requests_limit = asyncio.Semaphore(limit)
+    @fetch_profile
+    async def fetch_page(url: str, sink: Optional[Callable[[AsyncIterator[bytes], ContentInfo], Awaitable]] = None,
+                         _client: httpx.AsyncClient = client, _timeout: float = timeout,
+                         _requests_limit: asyncio.Semaphore = requests_limit):
+        start_ts = time.perf_counter()
+        # total timeout of request (as aiohttp.ClientTimeout(total=...) did) - including waits for limits and streaming
+        async with asyncio.timeout(_timeout), host_limit(_urlparse(url).netloc), _requests_limit, \
+                   _client.stream('GET', url) as response:
+            response.raise_for_status()  # if not 2xx ... raise HTTPStatusError - for now it's okay
+            content_info = parse_content_type(response.headers['Content-Type'])
+            if sink is None:
+                content = await response.aread()
+                profile_fetch(time.perf_counter() - start_ts, len(content))
+                return content, content_info
+            profile_fetch(time.perf_counter() - start_ts)  # up to response headers, body chunks are timed by _profiled_chunks
+            return await sink(_profiled_chunks(response.aiter_bytes(STREAM_CHUNK_SIZE)), content_info)
+    return fetch_page
+
+# total request timeouts are handled by asyncio.timeout per fetch (httpx.Timeout of client bounds each connect / read / write)
+# concurrency is bounded by httpx.Limits(max_connections=args.chunks) and requests / per host semaphores
+
+def load_seen(output: str) -> set[int]:
+    seen_path = Path(output).expanduser().resolve() / SEEN_FILE_NAME
+    if not seen_path.exists():
+        return set()
+    return set(int(digest, 16) for digest in seen_path.read_text().split())
+
+def save_seen(output: str, seen: set[int]):
+    output_dir = Path(output).expanduser().resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    seen_path = output_dir / SEEN_FILE_NAME
+    tmp_path = seen_path.with_suffix('.tmp')
+    tmp_path.write_text(''.join(f'{digest:016x}\n' for digest in seen))
+    os.replace(tmp_path, seen_path)  # atomic - no half-written .seen on crash
+
+_urlparse = lru_cache(maxsize=4096)(urlparse)
+
+def join_url(href: str) -> str:
+    # fast paths for absolute and root-relative hrefs (most of links) - urljoin re-parses both urls on each call
+    if href.startswith(('https://', 'http://')):
+        return href
+    if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+        return START_PAGE + href
+    return urljoin(START_PAGE, href)  # item?id=..., //host/..., #..., dot segments (/a/../b) etc.
+
+async def save_content(chunks: AsyncIterator[bytes], dir_path: Path, url: str, content_info: ContentInfo, prefix: str = ''):
+    logging.debug('Start saving content in [%s] from [%s] with [%s]', dir_path, url, content_info.mime)
+    url_parts = _urlparse(url)
     file_name = prefix + '_' +\
                 (url_parts.netloc.replace('.', '_') +\
                  url_parts.path.rstrip('/').replace('/', '__'))[-MAX_FILE_NAME_LENGTH + len(prefix):]
     file_name = Path(file_name)
-    file_name = dir_path / file_name.with_suffix(guess_extension(content_type.partition(';')[0].strip()))
+    file_name = dir_path / file_name.with_suffix(content_info.ext)
     logging.debug('-> [%s]', file_name)
-    # (file_name if file_name.suffix else file_name.with_suffix(guess_extension(content_type.partition(';')[0].strip())))
-    async with aiofiles.open(file_name, mode='wb') as af:  # encoding...
-        await af.write(content)
+    # (file_name if file_name.suffix else file_name.with_suffix(content_info.ext))
+    # content digest is known only when stream ends -> write into unique tmp file, then move it into cas (or drop it)
+    cas_dir = dir_path.parent / CAS_DIR_NAME
+    cas_dir.mkdir(exist_ok=True)
+    tmp_path = cas_dir / f'{uuid.uuid4().hex}.tmp'
+    hasher, size = xxhash.xxh3_128(), 0
+    try:
+        async with async_open(tmp_path, 'wb') as af:
+            async for chunk in chunks:
+                hasher.update(chunk)
+                size += len(chunk)
+                await af.write(chunk)
+        digest = hasher.hexdigest()
+        cas_path = cas_dir / (digest + file_name.suffix)
+        if cas_path.name not in _cas_names and not cas_path.exists():
+            os.replace(tmp_path, cas_path)
+            logging.debug('Content [%s] with length [%d] saved - ok', cas_path, size)
+        else:
+            tmp_path.unlink()
+            logging.debug('Content [%s] already saved - skip', cas_path)
+        _cas_names.add(cas_path.name)  # same bytes with another extension is another cas file
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_link = file_name.with_name(file_name.name + '.tmp')
+    tmp_link.unlink(missing_ok=True)
+    tmp_link.symlink_to(os.path.relpath(cas_path, dir_path))
+    os.replace(tmp_link, file_name)  # same named pages (e.g. youtube watch links) are overwritten as before
     logging.debug('File [%s] saved - ok', file_name)
     return str(file_name)
 
+async def as_result(coro: Awaitable):
+    # TaskGroup cancels all tasks on first error - errors are returned as results instead (like gather(return_exceptions=True))
+    try:
+        return await coro
+    except Exception as err:
+        return err
+
 async def process_comment(fetch_page: Callable, url: str, output_dir: Path):
-    content, content_type = await fetch_page(url)
-    return await save_content(content, output_dir, url, content_type, 'comm')
+    return await fetch_page(url, lambda chunks, content_info: save_content(chunks, output_dir, url, content_info, 'comm'))
 
 async def process_news(fetch_page: Callable, news_id: str, href: str, output: str):
     cv_news_id.set(news_id)
     stats = news_stats[news_id]
-    stats['status'] = 'in process'
+    stats.status = 'in process'
  
     output_dir = Path(output).expanduser().resolve() / news_id
     output_dir.mkdir(parents=True, exist_ok=True)
-    stats['dir'] = str(output_dir)
+    stats.dir = str(output_dir)
 
-    url = urljoin(START_PAGE, href)
-    stats['url'] = url
+    url = join_url(href)
+    stats.url = url
 
     # news 
-    content, content_type = await fetch_page(url)
-    stats['status'] = 'news loaded'
-    stats['file'] = await save_content(content, output_dir, url, content_type, 'news')
-    stats['status'] = 'news saved'
+    stats.status = 'news loading'
+    stats.file = await fetch_page(url, lambda chunks, content_info: save_content(chunks, output_dir, url, content_info, 'news'))
+    stats.status = 'news saved'
 
     # comments
-    content, content_type = await fetch_page(COMMENTS_PAGE_TEMPLATE.format(news_id=news_id))
-    tasks = []
-    visited_comments_url = set()
-    parser = BeautifulSoup(markup=content, from_encoding=content_type.partition('charset=')[-1], features='html.parser')
-    for comment_a_elem in parser.find_all('a', attrs={'rel': 'nofollow'}):
-        if (comment_url := urljoin(START_PAGE, comment_a_elem['href'])) not in visited_comments_url:
-            logging.info(f'Fetching comments for news id:{news_id} title:"{comment_a_elem.string}" from url:{comment_url}')
-            tasks.append(asyncio.create_task(process_comment(fetch_page, comment_url, output_dir)))
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    results = list(map(str, results))
+    content, content_info = await fetch_page(COMMENTS_PAGE_TEMPLATE.format(news_id=news_id))
+    visited_comments_hashes: set[int] = set()  # xxh3_64 of comment urls
+    parser = HTMLParser(decode_page(content, content_info))
+    async with asyncio.TaskGroup() as tg:
+        tasks = []
+        for comment_a_node in parser.css('a[rel~=nofollow]'):
+            if not (comment_href := comment_a_node.attributes.get('href')):  # no or valueless href
+                continue
+            comment_url = join_url(comment_href)
+            if (comment_hash := xxhash.xxh3_64_intdigest(comment_url)) not in visited_comments_hashes:
+                visited_comments_hashes.add(comment_hash)
+                logging.info(f'Fetching comments for news id:{news_id} title:"{comment_a_node.text()}" from url:{comment_url}')
+                tasks.append(tg.create_task(as_result(process_comment(fetch_page, comment_url, output_dir))))
+        # free page tree (nodes refer to it too) and body while comments are being processed
+        parser = comment_a_node = content = None
+    results = [str(task.result()) for task in tasks]
     # errors in comments processing will not be handled - see logs
     logging.debug('%s - comments processed with results: %s', news_id, results)
-    stats['comms_results'] = results
-    stats['status'] = 'ok'
+    stats.comms_results = results
+    stats.status = 'ok'
     return news_id
 
 async def async_main(args):
     session_counter = 0
-    news_processed = set()
-    while True:
-        logging.info('Start crawling session № %d', session_counter)
-        #chunks_semaphore = asyncio.Semaphore(args.chunks)
-        #tcp_conn = aiohttp.TCPConnector(limit_per_host=REQUEST_LIMIT_PER_HOST)
-        tcp_conn = aiohttp.TCPConnector(limit_per_host=REQUEST_LIMIT_PER_HOST, limit=args.chunks)
-        jar = aiohttp.DummyCookieJar()
-        session_timeout = aiohttp.ClientTimeout(total=args.total_session_timeout, connect=args.connection_timeout)
-        async with aiohttp.ClientSession(timeout=session_timeout, connector=tcp_conn, headers=_request_headers, cookie_jar=jar) as client_session:
-            # fetch_page = partial(sem_timed_session_fetch, sem = chunks_semaphore, timeout = args.timeout, session = client_session) # -> limit=args.chunks 
-            # fetch_page = partial(timed_session_fetch, timeout = args.timeout, session = client_session) # -> session_timeout
-            fetch_page = partial(session_fetch, session = client_session)
-            content, content_type = await fetch_page(START_PAGE)
+    news_processed: set[int] = load_seen(args.output)  # xxh3_64 of news ids (persisted between restarts)
+    logging.info('%d previously processed news loaded', len(news_processed))
+    # TCP_NODELAY is already set by event loop (uvloop / asyncio) for tcp transports
+    limits = httpx.Limits(max_connections=args.chunks, max_keepalive_connections=args.chunks,
+                          keepalive_expiry=REQUEST_KEEPALIVE_TIMEOUT)
+    jar = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))  # accepts no cookies
+    # httpx has no total request timeout (see fetch_page) - read/write/pool timeouts get args.total_session_timeout each
+    client_timeout = httpx.Timeout(args.total_session_timeout, connect=args.connection_timeout)
+    # client lives as long as crawler does - pooled (keep-alive, http/2 multiplexed) connections are reused by next sessions
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=client_timeout, headers=_request_headers,
+                                 cookies=jar, follow_redirects=True) as client:
+        fetch_page = make_fetch_page(client, args.total_session_timeout, args.chunks, args.limitperhost)
+        while True:
+            logging.info('Start crawling session № %d', session_counter)
+            content, content_info = await fetch_page(START_PAGE)
 
             tasks, news_ids = [], []
-            parser = BeautifulSoup(markup=content, from_encoding=content_type.partition('charset=')[-1], features='html.parser')
-            for news_tr_elem in parser.find_all('tr', 'athing', limit=args.top):
-                if (news_id := news_tr_elem['id']) not in news_processed:
-                    news_ids.append(news_id)
-                    news_a_elem = news_tr_elem.select_one("a.storylink")
-                    news_stats[news_id] = {
-                        'title': (news_title := news_a_elem.string),
-                        'url': (news_href := news_a_elem["href"]),
-                        'status': 'found',
-                    }
-                    logging.info('Fetching news id:%s title:"%s" from url:%s' % (news_id, news_title, news_href))
-                    tasks.append(asyncio.create_task(process_news(fetch_page, news_id, news_href, args.output)))
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            parser = HTMLParser(decode_page(content, content_info))
+            async with asyncio.TaskGroup() as tg:
+                for news_tr_node in parser.css('tr.athing')[:args.top]:
+                    if xxhash.xxh3_64_intdigest(news_id := news_tr_node.attributes['id']) not in news_processed:
+                        news_ids.append(news_id)
+                        news_a_node = news_tr_node.css_first("a.storylink")
+                        news_stats[news_id] = SimpleNamespace(
+                            title=(news_title := news_a_node.text()),
+                            url=(news_href := news_a_node.attributes["href"]),
+                            status='found',
+                            fetch_total_count=0,
+                            fetch_total_time=0.,
+                            fetch_total_size=0,
+                            fetch_ok_count=0,
+                        )
+                        logging.info('Fetching news id:%s title:"%s" from url:%s' % (news_id, news_title, news_href))
+                        tasks.append(tg.create_task(as_result(process_news(fetch_page, news_id, news_href, args.output))))
+                # free page tree (nodes refer to it too) and body while news are being processed
+                parser = news_tr_node = news_a_node = content = None
+            results = [task.result() for task in tasks]
             logging.debug('Results: %s', results)
-            results = list(map(str, results))
-            news_stats['results'] = results
             # at the next session, news with errors will be reloaded (probably)
             # this option is good for handling connection errors
             # as for the rest - normal resolutions have not yet been found -> see logs
-            news_session_processed = list(filter(lambda elm: type(elm) == str, results))
-            news_processed.update(news_session_processed)
+            news_session_processed = [result for result in results if isinstance(result, str)]
+            results = list(map(str, results))
+            news_stats['results'] = results
+            news_processed.update(map(xxhash.xxh3_64_intdigest, news_session_processed))
+            if news_session_processed:
+                save_seen(args.output, news_processed)
             logging.info('+ %d (from %d) fresh news successfully received. ids = %s', len(news_session_processed), len(news_stats), news_session_processed)
-        logging.info('Stop crawling session № %d', session_counter)
-        with open(f'news_stats_{time.strftime("%Y%m%d%H%M%S")}_{session_counter}.json', 'w') as f:
-            json.dump(news_stats, f)
-        news_stats.clear()        
-        await asyncio.sleep(args.restart)
-        session_counter += 1
+            logging.info('Stop crawling session № %d', session_counter)
+            stats_data = orjson.dumps(news_stats, default=vars)  # SimpleNamespace -> dict
+            async with async_open(f'news_stats_{time.strftime("%Y%m%d%H%M%S")}_{session_counter}.json', 'wb') as af:
+                await af.write(stats_data)
+            news_stats.clear()        
+            await asyncio.sleep(args.restart)
+            session_counter += 1
 
 if __name__ == '__main__':
     args = None
     try:
-        assert sys.version_info >= (3, 7), "Python 3.7+ required"
+        assert sys.version_info >= (3, 11), "Python 3.11+ required"
         args = parse_input_args()
         logging.basicConfig(filename=args.logfile,
                             format='[%(asctime)s] %(levelname).1s %(message)s',
                             datefmt='%Y.%m.%d %H:%M:%S',
                             level=args.loglevel.upper())
         logging.info('ycrawler started with args: %s', args)
+        gc.set_threshold(*GC_THRESHOLDS)
         uvloop.install()
         asyncio.run(async_main(args))
     except KeyboardInterrupt: